@@ -2,12 +2,20 @@
 
 __all__ = ("LogConfig", "setup_logger")
 
+import atexit
 import logging
 import sys
-from dataclasses import dataclass
+import time
+from copy import copy
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from io import TextIOWrapper
 from logging import Logger
-from textwrap import fill
-from typing import Final
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from queue import SimpleQueue
+from threading import Event
+from typing import Final, cast
 
 import colorama
 
@@ -16,13 +24,109 @@ _COLOR_WHITE: Final[str] = colorama.Fore.WHITE
 _DEFAULT_MSG_WIDTH: Final[int] = 110
 _DEFAULT_INDENT: Final[int] = 36
 _DEFAULT_LEVEL: Final[int] = logging.DEBUG
-_LEVEL_COLORS: Final[dict[str, str]] = {
-    "debug": colorama.Fore.BLUE,
-    "info": colorama.Fore.CYAN,
-    "warning": colorama.Fore.YELLOW,
-    "error": colorama.Fore.LIGHTRED_EX,
-    "critical": colorama.Fore.LIGHTMAGENTA_EX,
-}
+_FILE_BUFFER_SIZE: Final[int] = 64 * 1024
+_FILE_FLUSH_LEVEL: Final[int] = logging.ERROR
+# цвет по индексу levelno // 10: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+_LEVEL_COLORS: Final[tuple[str, ...]] = (
+    _COLOR_WHITE,
+    colorama.Fore.BLUE,
+    colorama.Fore.CYAN,
+    colorama.Fore.YELLOW,
+    colorama.Fore.LIGHTRED_EX,
+    colorama.Fore.LIGHTMAGENTA_EX,
+)
+_MAX_LEVEL_INDEX: Final[int] = len(_LEVEL_COLORS) - 1
+_WHITESPACE_TO_SPACE: Final[dict[int, int]] = str.maketrans("\t\n\x0b\x0c\r", "     ")
+_USE_COLOR: Final[bool] = sys.stdout is not None and sys.stdout.isatty()
+_LOGGERS: dict[str, Logger] = {}
+# общая очередь и флаг остановки единственного потока-слушателя
+_LOG_QUEUE: Final[SimpleQueue[logging.LogRecord]] = SimpleQueue()
+_LISTENER_STOPPED: Final[Event] = Event()
+_ROUTE_ATTR: Final[str] = "fastrag_target_handlers"
+
+
+@cache
+def _init_colorama() -> None:
+    """Однократно инициализирует colorama для всех форматтеров."""
+    colorama.init(autoreset=True)
+
+
+@lru_cache(maxsize=512)
+def _build_prefix(module_name: str, width: int, color: str) -> str:
+    """
+    Строит выровненный префикс модуля, общий для всех форматтеров
+
+    Args:
+        module_name: Имя модуля
+        width: Ширина поля имени модуля
+        color: ANSI-код цвета уровня или пустая строка без цвета
+
+    Returns:
+        Префикс строки лога
+
+    """
+    module_part = f"{module_name:<{width}}  "
+    if not color:
+        return module_part
+    return f"{color}{module_part}{_COLOR_WHITE}"
+
+
+def _wrap(message: str, width: int, indent: str) -> str:
+    """
+    Переносит сообщение по ASCII-пробелам за один проход
+
+    Слова длиннее строки разрываются жёстко, без квадратичного перебора.
+    На обычных лог-сообщениях результат совпадает с
+    textwrap.fill(break_on_hyphens=False), но это не полная замена:
+    переносов после дефисов нет, строка из одних начальных пробелов
+    не выводится, а «слова» из юникод-пробелов (NBSP, U+3000) в начале
+    строки не отбрасываются.
+
+    Args:
+        message: Исходное сообщение
+        width: Максимальная ширина строки вместе с отступом
+        indent: Отступ для строк после первой
+
+    Returns:
+        Сообщение с переносами строк и отступами
+
+    """
+    text = message.expandtabs().translate(_WHITESPACE_TO_SPACE).rstrip(" ")
+    length = len(text)
+    # при ширине < 1 цикл не продвигался бы по тексту
+    line_width = max(width, 1)
+    lines: list[str] = []
+    start = 0
+
+    while length - start > line_width:
+        end = start + line_width
+        # пробелы в начале сообщения длиннее строки отбрасываются кусками
+        # по ширине строки, без вывода пустых строк
+        if not lines and not text[start:end].strip(" "):
+            start = end
+            continue
+
+        space = text.rfind(" ", start, end + 1)
+        # слово длиннее целой строки дописывается до края и рвётся
+        word_end = text.find(" ", space + 1, space + line_width + 2)
+        if word_end == -1:
+            word_end = min(length, space + line_width + 2)
+        if space == -1 or (space < end and word_end - space - 1 > line_width):
+            line = text[start:end]
+            start = end
+        else:
+            line = text[start:space].rstrip(" ")
+            start = space + 1
+        while start < length and text[start] == " ":
+            start += 1
+
+        # строка только из начальных пробелов не выводится
+        if line:
+            lines.append(line)
+            line_width = max(width - len(indent), 1)
+
+    lines.append(text[start:])
+    return ("\n" + indent).join(lines)
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,6 +137,12 @@ class LogConfig:
     indent_length: int = _DEFAULT_INDENT
     level: int = _DEFAULT_LEVEL
     module_name_width: int = _MODULE_NAME_WIDTH
+    async_io: bool = False
+    indent_pad: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Однократно строит строку отступа для переносов сообщения."""
+        object.__setattr__(self, "indent_pad", " " * self.indent_length)
 
 
 class CustomFormatter(logging.Formatter):
@@ -52,9 +162,17 @@ class CustomFormatter(logging.Formatter):
 
         """
         super().__init__()
-        self._module_name = module_name
         self._config = config or LogConfig()
-        colorama.init(autoreset=True)
+        width = self._config.module_name_width
+        plain_prefix = _build_prefix(module_name, width, "")
+        self._prefix_by_level = (plain_prefix,) * len(_LEVEL_COLORS)
+
+        # при выводе в файл или pipe ANSI-коды только раздувают лог
+        if _USE_COLOR:
+            _init_colorama()
+            self._prefix_by_level = tuple(
+                _build_prefix(module_name, width, color) for color in _LEVEL_COLORS
+            )
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -67,25 +185,220 @@ class CustomFormatter(logging.Formatter):
             Форматированную строчку для лога
 
         """
-        level_name = record.levelname.lower()
-        color = _LEVEL_COLORS.get(level_name, _COLOR_WHITE)
+        level_index = min(record.levelno // 10, _MAX_LEVEL_INDEX)
+        prefix = self._prefix_by_level[level_index]
 
-        message = fill(
-            record.getMessage(),
-            width=self._config.msg_width,
-            subsequent_indent=" " * self._config.indent_length,
-        )
+        message = record.getMessage()
+        if "\n" in message or len(message) > self._config.msg_width:
+            message = _wrap(
+                message,
+                width=self._config.msg_width,
+                indent=self._config.indent_pad,
+            )
 
-        module_part = f"{self._module_name:<{self._config.module_name_width}}"
-        formatted_msg = f"{color}{module_part}  {_COLOR_WHITE}{message}"
+        formatted_msg = prefix + message
 
         if record.exc_info:
-            traceback_str = self.formatException(record.exc_info)
-            return f"{formatted_msg}\n{traceback_str}"
+            return formatted_msg + "\n" + self.formatException(record.exc_info)
+
+        return formatted_msg
+
+
+class _FileFormatter(logging.Formatter):
+    """Форматтер файла лога вида «время - уровень - сообщение» без %-шаблона."""
+
+    def __init__(self) -> None:
+        """Инициализация класса с пустым кешем времени"""
+        super().__init__()
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def _format_time(self, record: logging.LogRecord) -> str:
+        """
+        Форматирует время записи, вызывая strftime не чаще раза в секунду
+
+        Args:
+            record (LogRecord): поступающий лог
+
+        Returns:
+            Время в формате asctime стандартного Formatter
+
+        """
+        second = int(record.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = time.strftime(
+                self.default_time_format,
+                self.converter(record.created),
+            )
+            self._time_cache = (second, cached_time)
+        return f"{cached_time},{int(record.msecs):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Переопределение модуля родителя, собирающее строку конкатенацией
+
+        Args:
+            record (LogRecord): поступающий лог
+
+        Returns:
+            Форматированную строчку для лога
+
+        """
+        formatted_msg = (
+            self._format_time(record)
+            + " - "
+            + record.levelname
+            + " - "
+            + record.getMessage()
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            formatted_msg += "\n" + record.exc_text
+        if record.stack_info:
+            formatted_msg += "\n" + self.formatStack(record.stack_info)
 
         return formatted_msg
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """Файловый обработчик, сбрасывающий записи на диск пачками."""
+
+    def _open(self) -> TextIOWrapper:
+        """
+        Открывает файл лога с увеличенным буфером записи
+
+        Returns:
+            Текстовый поток файла лога
+
+        """
+        stream = Path(self.baseFilename).open(  # noqa: SIM115
+            self.mode,
+            buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        return cast(TextIOWrapper, stream)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Записывает лог в буфер, сбрасывая его на диск только для ошибок
+
+        Args:
+            record (LogRecord): поступающий лог
+
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= _FILE_FLUSH_LEVEL:
+                self.stream.flush()
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+
+def _dispatch(
+    record: logging.LogRecord,
+    handlers: tuple[logging.Handler, ...],
+) -> None:
+    """
+    Передаёт запись обработчикам с учётом их уровня
+
+    Args:
+        record: Запись лога
+        handlers: Обработчики логгера, создавшего запись
+
+    """
+    for handler in handlers:
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+class _QueueRouter(logging.Handler):
+    """Раздаёт записи из общей очереди обработчикам исходного логгера."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Передаёт запись обработчикам, указанным при постановке в очередь
+
+        Args:
+            record (LogRecord): запись из очереди
+
+        """
+        _dispatch(record, getattr(record, _ROUTE_ATTR, ()))
+
+
+def _stop_queue_listener(listener: QueueListener) -> None:
+    """
+    Останавливает слушателя, дописав уже поставленные в очередь записи
+
+    Args:
+        listener: Общий слушатель очереди
+
+    """
+    _LISTENER_STOPPED.set()
+    listener.stop()
+
+
+@cache
+def _start_queue_listener() -> None:
+    """Однократно запускает общий для всех логгеров поток-слушатель."""
+    listener = QueueListener(_LOG_QUEUE, _QueueRouter())
+    listener.start()
+    atexit.register(_stop_queue_listener, listener)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Кладёт запись в общую очередь, оставляя оформление строки слушателю."""
+
+    def __init__(self, handlers: tuple[logging.Handler, ...]) -> None:
+        """
+        Инициализация класса
+
+        Args:
+            handlers (tuple[Handler, ...]): обработчики, которым слушатель
+                передаст записи этого логгера
+
+        """
+        super().__init__(_LOG_QUEUE)
+        self._handlers = handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Переопределение метода родителя: в вызывающем потоке только
+        подставляются аргументы, префикс, переносы и traceback делает слушатель
+
+        Args:
+            record (LogRecord): поступающий лог
+
+        Returns:
+            Копию записи с готовым сообщением и без аргументов
+
+        """
+        # аргументы фиксируются сразу, иначе их изменения попадут в лог
+        prepared = copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        setattr(prepared, _ROUTE_ATTR, self._handlers)
+        return prepared
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Ставит запись в очередь, а после остановки слушателя при выходе
+        из программы передаёт её обработчикам напрямую
+
+        Args:
+            record (LogRecord): поступающий лог
+
+        """
+        if _LISTENER_STOPPED.is_set():
+            _dispatch(record, self._handlers)
+            return
+        super().emit(record)
+
+
 def setup_logger(
     module_name: str,
     path_to_log_file: str | None = None,
@@ -103,6 +416,11 @@ def setup_logger(
         Настроенный логгер
 
     """
+    # кеш верен, только пока настроенные здесь обработчики не сняты
+    cached_logger = _LOGGERS.get(module_name)
+    if cached_logger is not None and cached_logger.handlers:
+        return cached_logger
+
     config = config or LogConfig()
     formated_logger: Logger = logging.getLogger(module_name)
 
@@ -116,16 +434,22 @@ def setup_logger(
     console_handler.setFormatter(
         CustomFormatter(module_name=module_name, config=config),
     )
-    formated_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     if path_to_log_file:
-        file_handler = logging.FileHandler(path_to_log_file, encoding="utf-8")
-        file_formatter = logging.Formatter(
-            fmt="%(asctime)s - %(levelname)s - %(message)s",
-        )
-        file_handler.setFormatter(file_formatter)
-        formated_logger.addHandler(file_handler)
-
+        file_handler = _BufferedFileHandler(path_to_log_file, encoding="utf-8")
+        file_handler.setFormatter(_FileFormatter())
+        handlers.append(file_handler)
+
+    if config.async_io:
+        # запись в stdout/файл выполняется в общем потоке слушателя
+        _start_queue_listener()
+        formated_logger.addHandler(_DeferredQueueHandler(tuple(handlers)))
+    else:
+        for handler in handlers:
+            formated_logger.addHandler(handler)
+
+    _LOGGERS[module_name] = formated_logger
     return formated_logger
 
 